@@ -1,36 +1,56 @@
 """Entity Glossary extension tools."""
 
 from typing import Any, Dict, List
+import io
 
 
 ENTITY_TYPES = ["character", "location", "concept", "item", "rule", "custom"]
+_TYPE_HEADERS = {entity_type: f"## {entity_type.title()}" for entity_type in ENTITY_TYPES}
+
+
+def _write_entities(write, entity_type: str, entities: List[Dict[str, Any]], include_aliases: bool) -> None:
+    join_aliases = ", ".join
+    write(_TYPE_HEADERS.get(entity_type) or f"## {entity_type.title()}")
+    write("\n")
+    for entity in sorted(entities, key=lambda e: e.get("name", "")):
+        eget = entity.get
+        name = eget("name", "Untitled")
+        description = eget("description") or ""
+        aliases = eget("aliases") if include_aliases else None
+        description_part = f": {description}" if description else ""
+        aliases_part = f" (aliases: {join_aliases(aliases)})" if aliases else ""
+        write(f"- **{name}**{description_part}{aliases_part}\n")
 
 
 def entity_glossary(ctx, arguments: Dict[str, Any]) -> str:
     types = arguments.get("types") or ENTITY_TYPES
     include_aliases = bool(arguments.get("include_aliases", False))
 
-    sections: List[str] = []
+    # Write lines straight into one buffer rather than holding a list of
+    # every line until the final join.
+    buf = io.StringIO()
+    write = buf.write
+
+    # Single-type requests are the common case; skip the multi-type loop.
+    if len(types) == 1:
+        entity_type = types[0]
+        entities = ctx.list_entities_by_type(entity_type)
+        if not entities:
+            return "No entities found for the selected types."
+        _write_entities(write, entity_type, entities, include_aliases)
+        return buf.getvalue().rstrip()
+
     for entity_type in types:
         entities = ctx.list_entities_by_type(entity_type)
         if not entities:
             continue
-        sections.append(f"## {entity_type.title()}")
-        for entity in sorted(entities, key=lambda e: e.get("name", "")):
-            line = f"- **{entity.get('name', 'Untitled')}**"
-            description = entity.get("description") or ""
-            if description:
-                line += f": {description}"
-            if include_aliases and entity.get("aliases"):
-                aliases = ", ".join(entity.get("aliases", []))
-                line += f" (aliases: {aliases})"
-            sections.append(line)
-        sections.append("")
+        _write_entities(write, entity_type, entities, include_aliases)
+        write("\n")
 
-    if not sections:
+    if not buf.tell():
         return "No entities found for the selected types."
 
-    return "\n".join(sections).strip()
+    return buf.getvalue().strip()
 
 
 def entity_relationships(ctx, arguments: Dict[str, Any]) -> str:
@@ -54,7 +54,7 @@ def on_project_open(ctx: Any, arguments: Dict[str, Any]) -> str:
     """
     project = arguments.get("project", {})
     project_name = project.get("name", "Unknown")
-    logger.info(f"[HelloExtension] Project opened: {project_name}")
+    logger.info("[HelloExtension] Project opened: %s", project_name)
     return f"Noted project open: {project_name}"
 
 
@@ -84,8 +84,10 @@ def on_section_save(ctx: Any, arguments: Dict[str, Any]) -> str:
     """
     section = arguments.get("section", {})
     section_title = section.get("title", "Unknown")
-    content_length = len(section.get("content", ""))
-    logger.info(f"[HelloExtension] Section saved: {section_title} ({content_length} chars)")
+    # Saves are frequent; only measure the content when it will be logged.
+    if logger.isEnabledFor(logging.INFO):
+        content_length = len(section.get("content", ""))
+        logger.info("[HelloExtension] Section saved: %s (%d chars)", section_title, content_length)
     return f"Tracked save: {section_title}"
 
 
@@ -100,7 +102,7 @@ def on_section_delete(ctx: Any, arguments: Dict[str, Any]) -> str:
         Status message
     """
     section_id = arguments.get("sectionId", "Unknown")
-    logger.info(f"[HelloExtension] Section deleted: {section_id}")
+    logger.info("[HelloExtension] Section deleted: %s", section_id)
     return f"Noted deletion: {section_id}"
 
 
@@ -117,5 +119,5 @@ def on_entity_change(ctx: Any, arguments: Dict[str, Any]) -> str:
     entity = arguments.get("entity", {})
     entity_name = entity.get("name", "Unknown")
     entity_type = entity.get("type", "unknown")
-    logger.info(f"[HelloExtension] Entity changed: {entity_name} ({entity_type})")
+    logger.info("[HelloExtension] Entity changed: %s (%s)", entity_name, entity_type)
     return f"Tracked entity change: {entity_name}"
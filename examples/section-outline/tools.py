@@ -1,15 +1,25 @@
 """Section Outline extension tools."""
 
+from operator import itemgetter
 from typing import Any, Dict, List, Tuple
+import re
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Filename ordering prefix, e.g. "sections/001-intro.md".
+_ORDER_PREFIX_RE = re.compile(r"(?:.*/)?(\d+)-[^/]*$")
+
 
 def _parse_frontmatter(text: str) -> Dict[str, Any]:
-    if text.startswith("---"):
-        parts = text.split("---", 2)
-        if len(parts) >= 3:
-            return yaml.safe_load(parts[1]) or {}
-    return {}
+    if not text.startswith("---"):
+        return {}
+    # Only scan up to the closing fence; the section body is never parsed.
+    end = text.find("\n---", 3)
+    if end < 0:
+        return {}
+    return yaml.load(text[3:end], Loader=_YamlLoader) or {}
 
 
 def section_outline(ctx, arguments: Dict[str, Any]) -> str:
@@ -26,12 +36,10 @@ def section_outline(ctx, arguments: Dict[str, Any]) -> str:
         order = frontmatter.get("order")
         if order is None:
             # Try to parse from filename prefix (001-*)
-            try:
-                order = int(path.split("/")[-1].split("-")[0])
-            except Exception:
-                order = 0
+            match = _ORDER_PREFIX_RE.match(path)
+            order = int(match.group(1)) if match else 0
         entries.append((int(order), title))
 
-    entries.sort(key=lambda item: item[0])
+    entries.sort(key=itemgetter(0))
     lines = [f"{order}. {title}" for order, title in entries]
     return "\n".join(lines)
@@ -36,10 +36,19 @@ def tag_overview(ctx, arguments: Dict[str, Any]) -> str:
     if not tags:
         return "No tags found for this section."
 
+    # A section usually tags the same entity many times; resolve each once.
+    names: Dict[Any, Any] = {}
     lines: List[str] = []
+    append = lines.append
     for tag in tags:
-        entity = ctx.get_entity_by_id(tag.get("entityId"))
-        name = entity.get("name") if entity else tag.get("entityId", "unknown")
-        lines.append(f"- {name}: {tag.get('from')}..{tag.get('to')} (tag {tag.get('id')})")
+        tget = tag.get
+        entity_id = tget("entityId")
+        if entity_id in names:
+            name = names[entity_id]
+        else:
+            entity = ctx.get_entity_by_id(entity_id)
+            name = entity.get("name") if entity else tget("entityId", "unknown")
+            names[entity_id] = name
+        append(f"- {name}: {tget('from')}..{tget('to')} (tag {tget('id')})")
 
     return "\n".join(lines)